@@ -48,10 +48,7 @@ For more information, see the project documentation at:
 https://github.com/beecave-homelab/subber
 """
 
-from .core.matcher import collect_files, find_matches
-from .core.types import VideoPath, SubtitlePath, ExactMatch, CloseMatch, MatchResult
-from .utils.file_ops import rename_close_matches, move_unmatched_files
-from .utils.display import display_results
+import importlib
 
 __version__ = "0.2.0"
 __author__ = "elvee"
@@ -73,3 +70,30 @@ __all__ = [
     "move_unmatched_files",
     "display_results",
 ]
+
+# Public names are resolved on first access (PEP 562), so importing the package
+# does not pull in Rich or questionary until a helper that needs them is used
+_LAZY_IMPORTS = {
+    "collect_files": "subber.core.matcher",
+    "find_matches": "subber.core.matcher",
+    "VideoPath": "subber.core.types",
+    "SubtitlePath": "subber.core.types",
+    "ExactMatch": "subber.core.types",
+    "CloseMatch": "subber.core.types",
+    "MatchResult": "subber.core.types",
+    "rename_close_matches": "subber.utils.file_ops",
+    "move_unmatched_files": "subber.utils.file_ops",
+    "display_results": "subber.utils.display",
+}
+
+def __getattr__(name):
+    """Import a public name from its defining module on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
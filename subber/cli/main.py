@@ -5,26 +5,36 @@ Command-line interface for the subber package.
 import logging
 import click
 from pathlib import Path
-from rich.logging import RichHandler
-from rich.console import Console
-from rich import box
-from rich.text import Text
 
+# Rich, questionary and better-ffmpeg-progress are imported inside main() and only
+# for the features that need them, so `subber --help` stays fast to start
 from subber.core.matcher import collect_files, find_matches
-from subber.utils.display import show_ascii_art, display_results
-from subber.utils.file_ops import rename_close_matches, move_unmatched_files
-from subber.utils.converter import batch_convert_to_mp3, check_ffmpeg_installed
 from subber.utils.logging import setup_logging
 from subber.core.constants import (
     LOGS_DIR, 
     AUDIO_CONVERSION, 
     MESSAGES, 
-    THIRD_PARTY_LOG_LEVELS,
-    CONSOLE_STYLES
+    THIRD_PARTY_LOG_LEVELS
 )
 
-# Initialize Rich console
-console = Console()
+# How known `extra` keys are rendered after a log message
+_EXTRA_FORMATS = {
+    'path': "path='{}'",
+    'basename': "file='{}'",
+    'file_count': "count={}",
+    'input_file': "input='{}'",
+    'output_file': "output='{}'",
+    'error': "error='{}'",
+}
+
+# `extra` keys whose (multi-line) ffmpeg output is appended on new lines
+_EXTRA_MULTILINE = frozenset({'ffmpeg_output', 'ffmpeg_error'})
+
+# `extra={...}` sets its keys as plain record attributes, so anything that is not a
+# standard LogRecord attribute (or one set while formatting or by Rich) is an extra
+_RECORD_ATTRIBUTES = frozenset(logging.makeLogRecord({}).__dict__) | {
+    'message', 'asctime', 'markup', 'highlighter'
+}
 
 class RichFileFormatter(logging.Formatter):
     """Custom formatter that handles extra parameters and formats them nicely."""
@@ -33,35 +43,31 @@ class RichFileFormatter(logging.Formatter):
         # Format the basic message
         message = super().format(record)
         
-        # If there are extra parameters, format them nicely
-        if hasattr(record, 'extra'):
-            extras = []
-            for key, value in record.extra.items():
-                if key == 'path':
-                    extras.append(f"path='{value}'")
-                elif key == 'basename':
-                    extras.append(f"file='{value}'")
-                elif key == 'file_count':
-                    extras.append(f"count={value}")
-                elif key == 'input_file':
-                    extras.append(f"input='{value}'")
-                elif key == 'output_file':
-                    extras.append(f"output='{value}'")
-                elif key == 'error':
-                    extras.append(f"error='{value}'")
-                elif key == 'ffmpeg_output':
-                    # Format ffmpeg output on new lines
-                    message += f"\n{value}"
-                    continue
-                elif key == 'ffmpeg_error':
-                    # Format ffmpeg errors on new lines
-                    message += f"\n{value}"
-                    continue
-                else:
-                    extras.append(f"{key}={value}")
-            
-            if extras:
-                message += f" ({', '.join(extras)})"
+        # Format the extra parameters nicely
+        extras = []
+        multiline = []
+        for key, value in record.__dict__.items():
+            if key in _RECORD_ATTRIBUTES:
+                continue
+            template = _EXTRA_FORMATS.get(key)
+            if template is not None:
+                extras.append(template.format(value))
+            elif key in _EXTRA_MULTILINE:
+                # Format ffmpeg output and errors on new lines
+                multiline.append(f"\n{value}")
+            else:
+                extras.append(f"{key}={value}")
+        
+        # Most records carry no extra parameters; return them without further work
+        if not (extras or multiline):
+            return message
+        
+        # Extras hold paths and ffmpeg output, which must not be read as Rich markup
+        from rich.markup import escape
+        if multiline:
+            message += escape("".join(multiline))
+        if extras:
+            message += escape(f" ({', '.join(extras)})")
         
         return message
 
@@ -84,11 +90,10 @@ def main(directory, output_file, no_table, path, move_unmatched, rename, convert
     and subtitle files (.srt), matches them based on filename similarity, and
     provides options for renaming and organizing the files.
     """
-    # Configure logging
-    log_level = "DEBUG" if verbose else "WARNING"
-    log_file_path = Path(log_file) if log_file else None
-    setup_logging(log_level=log_level, log_file=log_file_path)
-    
+    from rich.highlighter import NullHighlighter
+    from rich.logging import RichHandler
+    from subber.utils.display import console, show_ascii_art, display_results, STYLES
+
     # Configure Rich handler
     rich_handler = RichHandler(
         rich_tracebacks=True,
@@ -100,11 +105,14 @@ def main(directory, output_file, no_table, path, move_unmatched, rename, convert
         console=console,
         tracebacks_extra_lines=2,
         tracebacks_theme="monokai",
+        highlighter=NullHighlighter(),  # None would fall back to ReprHighlighter
     )
     rich_handler.setFormatter(RichFileFormatter("%(message)s"))
     
-    # Add Rich handler to root logger
-    logging.getLogger().addHandler(rich_handler)
+    # Configure logging with the Rich handler as the only console output
+    log_level = "DEBUG" if verbose else "WARNING"
+    log_file_path = Path(log_file) if log_file else None
+    setup_logging(log_level=log_level, log_file=log_file_path, console_handler=rich_handler)
     
     # Silence other loggers unless in verbose mode
     if not verbose:
@@ -120,7 +128,7 @@ def main(directory, output_file, no_table, path, move_unmatched, rename, convert
 
     dir_path = Path(directory).resolve()
     if not dir_path.exists():
-        console.print(f"[red]Directory {dir_path} does not exist![/red]")
+        console.print(f"Directory {dir_path} does not exist!", style=STYLES["error"], markup=False)
         return
 
     # 1. Collect files
@@ -143,29 +151,34 @@ def main(directory, output_file, no_table, path, move_unmatched, rename, convert
 
     # 4. Optionally rename
     if rename and close_matches:
+        from subber.utils.file_ops import rename_close_matches
         rename_close_matches(close_matches)
 
     # 5. Optionally convert videos to MP3
     if convert is not None and unmatched_videos:
+        from subber.utils.converter import batch_convert_to_mp3, check_ffmpeg_installed
+
         if not check_ffmpeg_installed():
-            console.print(MESSAGES["FFMPEG_NOT_INSTALLED"], style=CONSOLE_STYLES["error"])
+            console.print(MESSAGES["FFMPEG_NOT_INSTALLED"], style=STYLES["error"])
             return
             
         convert_output_dir = dir_path / convert
         
         # Convert selected video files
-        converted = batch_convert_to_mp3([Path(v) for v in unmatched_videos], convert_output_dir)
+        converted = batch_convert_to_mp3(unmatched_videos, convert_output_dir)
         if converted > 0:
-            console.print(f"\nSuccessfully converted {converted} files to MP3.", style=CONSOLE_STYLES["success"])
-            console.print(f"MP3 files saved in: {convert_output_dir}", style=CONSOLE_STYLES["success"])
+            console.print(f"\nSuccessfully converted {converted} files to MP3.", style=STYLES["success"])
+            console.print(f"MP3 files saved in: {convert_output_dir}", style=STYLES["success"])
 
     # 6. Optionally move unmatched
     if move_unmatched:
+        from subber.utils.file_ops import move_unmatched_files
         move_unmatched_files(unmatched_videos, move_unmatched, dir_path)
 
 if __name__ == "__main__":
     try:
         main()
     except (KeyboardInterrupt, EOFError):
-        console.print(f"\n{MESSAGES['OPERATION_CANCELLED']}", style=CONSOLE_STYLES["warning"])
+        from subber.utils.display import console, STYLES
+        console.print(f"\n{MESSAGES['OPERATION_CANCELLED']}", style=STYLES["warning"])
         exit(0) 
\ No newline at end of file
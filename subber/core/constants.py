@@ -3,16 +3,19 @@ Constants used throughout the subber package.
 """
 
 from pathlib import Path
-from typing import Set, Dict
+from typing import FrozenSet, Dict
 
-# File extensions
-VIDEO_EXTENSIONS: Set[str] = {".mkv", ".mov", ".mp4"}
-SUBTITLE_EXTENSIONS: Set[str] = {".srt"}
+# File extensions (lowercase; callers lowercase the suffix once before lookup)
+VIDEO_EXTENSIONS: FrozenSet[str] = frozenset({".mkv", ".mov", ".mp4"})
+SUBTITLE_EXTENSIONS: FrozenSet[str] = frozenset({".srt"})
 
 # Matching configuration
 DEFAULT_MIN_SIMILARITY: float = 0.3
 DATE_SIMILARITY_BOOST: float = 0.3
 
+# Interactive prompts
+BULK_RENAME_THRESHOLD: int = 20  # Offer "rename all" before the checkbox above this many close matches
+
 # Logging configuration
 LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_DATE_FORMAT: str = "%Y-%m-%d %H:%M:%S"
@@ -78,8 +81,10 @@ TABLE_SETTINGS = {
 # Audio conversion settings
 AUDIO_CONVERSION = {
     "DEFAULT_OUTPUT_DIR": "audio_files",
+    "MAX_WORKERS": None,  # Concurrent ffmpeg processes; None uses os.cpu_count()
     "FFMPEG_SETTINGS": {
         "quality": "0",  # Highest quality
+        "threads": "1",  # Per ffmpeg process; the MP3 encoder is single-threaded
         "log_level": "error",
         "map": "a"  # Extract only audio
     }
@@ -91,6 +96,7 @@ MESSAGES = {
     "NO_CLOSE_MATCHES": "No close matches found.",
     "ALL_VIDEOS_MATCHED": "All video files have matching subtitles.",
     "ALL_SUBS_MATCHED": "All subtitle files have matching videos.",
+    "NO_FILES_FOUND": "No video or subtitle files found.",
     "OPERATION_CANCELLED": "Operation cancelled by user",
     "FFMPEG_NOT_INSTALLED": "Error: ffmpeg is not installed. Please install it to use the conversion feature."
 }
@@ -100,4 +106,4 @@ THIRD_PARTY_LOG_LEVELS = {
     "questionary": "WARNING",
     "rich": "WARNING",
     "click": "WARNING"
-} 
\ No newline at end of file
+}
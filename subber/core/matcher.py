@@ -13,9 +13,11 @@ Example:
 """
 
 import logging
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Set, Dict, Optional, cast
+from typing import List, Tuple, Set, FrozenSet, Dict, Optional, cast
 from datetime import datetime
 
 from .constants import (
@@ -27,7 +29,7 @@ from .constants import (
 from .types import (
     FilePath, VideoPath, SubtitlePath,
     ExactMatch, CloseMatch, MatchResult,
-    NormalizedWords, FileMapping, FileCollection
+    NormalizedWords, FileCollection
 )
 
 logger = logging.getLogger(__name__)
@@ -40,6 +42,60 @@ class InvalidPathError(MatcherError):
     """Raised when a path is invalid or inaccessible."""
     pass
 
+# Common separator pattern that matches dots, hyphens, and spaces
+_SEP = r'[\.\- ]+'
+
+# Pattern for YYYY-MM-DD format
+_PATTERN_YMD = rf'(?:^|\D)(?P<year_ymd>[0-9]{{4}}){_SEP}(?P<month_ymd>[0-9]{{2}}){_SEP}(?P<day_ymd>[0-9]{{2}})(?:\D|$)'
+
+# Pattern for DD-MM-YYYY format
+_PATTERN_DMY = rf'(?:^|\D)(?P<day_dmy>[0-9]{{2}}){_SEP}(?P<month_dmy>[0-9]{{2}}){_SEP}(?P<year_dmy>[0-9]{{4}})(?:\D|$)'
+
+# Pattern for YY-MM-DD format
+_PATTERN_SHORT_YMD = rf'(?:^|\D)(?P<year_short_ymd>[0-9]{{2}}){_SEP}(?P<month_short_ymd>[0-9]{{2}}){_SEP}(?P<day_short_ymd>[0-9]{{2}})(?:\D|$)'
+
+# Pattern for DD-MM-YY format
+_PATTERN_SHORT_DMY = rf'(?:^|\D)(?P<day_short_dmy>[0-9]{{2}}){_SEP}(?P<month_short_dmy>[0-9]{{2}}){_SEP}(?P<year_short_dmy>[0-9]{{2}})(?:\D|$)'
+
+# Compact formats without separators
+_PATTERN_COMPACT_YMD = r'(?:^|\D)(?P<year_compact>[0-9]{4})(?P<month_compact>[0-9]{2})(?P<day_compact>[0-9]{2})(?:\D|$)'
+_PATTERN_COMPACT_DMY = r'(?:^|\D)(?P<day_compact_dmy>[0-9]{2})(?P<month_compact_dmy>[0-9]{2})(?P<year_compact_dmy>[0-9]{4})(?:\D|$)'
+_PATTERN_COMPACT_SHORT_DMY = r'(?:^|\D)(?P<day_compact_short>[0-9]{2})(?P<month_compact_short>[0-9]{2})(?P<year_compact_short>[0-9]{2})(?:\D|$)'
+
+def _compile_date_pattern(pattern: str) -> Tuple[re.Pattern, int, int, int]:
+    """Compile a date pattern along with the indexes of its year, month and day groups."""
+    compiled = re.compile(pattern)
+    group_indexes = {
+        name.split('_', 1)[0]: index for name, index in compiled.groupindex.items()
+    }
+    return compiled, group_indexes['year'], group_indexes['month'], group_indexes['day']
+
+# Every date pattern needs digits; names without any skip the patterns entirely
+_HAS_DIGIT = re.compile(r'[0-9]')
+
+# All patterns to try, in priority order, compiled once at import time
+_DATE_PATTERNS = [_compile_date_pattern(pattern) for pattern in (
+    _PATTERN_YMD,                    # YYYY-MM-DD
+    _PATTERN_DMY,                    # DD-MM-YYYY
+    _PATTERN_SHORT_YMD,              # YY-MM-DD
+    _PATTERN_SHORT_DMY,              # DD-MM-YY
+    _PATTERN_COMPACT_YMD,            # YYYYMMDD
+    _PATTERN_COMPACT_DMY,            # DDMMYYYY
+    _PATTERN_COMPACT_SHORT_DMY,      # DDMMYY
+
+    # Parentheses enclosed versions
+    rf'\({_PATTERN_YMD}\)',
+    rf'\({_PATTERN_DMY}\)',
+    rf'\({_PATTERN_SHORT_YMD}\)',
+    rf'\({_PATTERN_SHORT_DMY}\)'
+)]
+
+# Every non-alphanumeric ASCII character separates words; the translation table
+# handles plain ASCII stems and the regex everything else
+_ASCII_SEPARATORS = {code: ' ' for code in range(128) if not chr(code).isalnum()}
+_WORD_SPLIT = re.compile(r'[\W_]+')
+
+@lru_cache(maxsize=4096)
 def extract_date(filename: str) -> Optional[datetime]:
     """
     Extract a date from a filename using various common formats.
@@ -61,64 +117,23 @@ def extract_date(filename: str) -> Optional[datetime]:
         >>> extract_date("no_date_here.mp4")
         None
     """
-    # Common separator pattern that matches dots, hyphens, and spaces
-    sep = r'[\.\- ]+'
-    
-    # Pattern for YYYY-MM-DD format
-    pattern_ymd = rf'(?:^|\D)(?P<year_ymd>[0-9]{{4}}){sep}(?P<month_ymd>[0-9]{{2}}){sep}(?P<day_ymd>[0-9]{{2}})(?:\D|$)'
-    
-    # Pattern for DD-MM-YYYY format
-    pattern_dmy = rf'(?:^|\D)(?P<day_dmy>[0-9]{{2}}){sep}(?P<month_dmy>[0-9]{{2}}){sep}(?P<year_dmy>[0-9]{{4}})(?:\D|$)'
-    
-    # Pattern for YY-MM-DD format
-    pattern_short_ymd = rf'(?:^|\D)(?P<year_short_ymd>[0-9]{{2}}){sep}(?P<month_short_ymd>[0-9]{{2}}){sep}(?P<day_short_ymd>[0-9]{{2}})(?:\D|$)'
-    
-    # Pattern for DD-MM-YY format
-    pattern_short_dmy = rf'(?:^|\D)(?P<day_short_dmy>[0-9]{{2}}){sep}(?P<month_short_dmy>[0-9]{{2}}){sep}(?P<year_short_dmy>[0-9]{{2}})(?:\D|$)'
-    
-    # Compact formats without separators
-    pattern_compact_ymd = r'(?:^|\D)(?P<year_compact>[0-9]{4})(?P<month_compact>[0-9]{2})(?P<day_compact>[0-9]{2})(?:\D|$)'
-    pattern_compact_dmy = r'(?:^|\D)(?P<day_compact_dmy>[0-9]{2})(?P<month_compact_dmy>[0-9]{2})(?P<year_compact_dmy>[0-9]{4})(?:\D|$)'
-    pattern_compact_short_dmy = r'(?:^|\D)(?P<day_compact_short>[0-9]{2})(?P<month_compact_short>[0-9]{2})(?P<year_compact_short>[0-9]{2})(?:\D|$)'
-    
-    # All patterns to try
-    patterns = [
-        pattern_ymd,                    # YYYY-MM-DD
-        pattern_dmy,                    # DD-MM-YYYY
-        pattern_short_ymd,              # YY-MM-DD
-        pattern_short_dmy,              # DD-MM-YY
-        pattern_compact_ymd,            # YYYYMMDD
-        pattern_compact_dmy,            # DDMMYYYY
-        pattern_compact_short_dmy,      # DDMMYY
-        
-        # Parentheses enclosed versions
-        rf'\({pattern_ymd}\)',
-        rf'\({pattern_dmy}\)',
-        rf'\({pattern_short_ymd}\)',
-        rf'\({pattern_short_dmy}\)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, filename)
+    if not _HAS_DIGIT.search(filename):
+        return None
+
+    for pattern, year_group, month_group, day_group in _DATE_PATTERNS:
+        match = pattern.search(filename)
         if match:
             try:
-                groups = match.groupdict()
-                
-                # Find the matched group names (they'll end with the format type)
-                year_key = next(k for k in groups.keys() if k.startswith('year_') and groups[k])
-                month_key = next(k for k in groups.keys() if k.startswith('month_') and groups[k])
-                day_key = next(k for k in groups.keys() if k.startswith('day_') and groups[k])
-                
-                year = groups[year_key]
-                month = int(groups[month_key])
-                day = int(groups[day_key])
+                year = match.group(year_group)
+                month = int(match.group(month_group))
+                day = int(match.group(day_group))
                 
                 # Handle 2-digit years
                 if len(year) == 2:
                     year = '20' + year if int(year) < 50 else '19' + year
                 
                 return datetime(int(year), month, day)
-            except (ValueError, IndexError, StopIteration):
+            except ValueError:
                 continue
     
     return None
@@ -146,20 +161,30 @@ def normalize_filename(filename: FilePath) -> NormalizedWords:
         {'my', 'cool', 'video', '01'}
     """
     try:
-        path = Path(filename)
-        base = path.stem.lower()
-        words = re.split(r'\W+', base)
-        words = [word for word in words if word]  # remove empty strings
-        return set(words)
+        return set(_split_words(Path(filename).stem.lower()))
     except Exception as e:
         raise InvalidPathError(f"Failed to normalize filename {filename}: {e}")
 
+@lru_cache(maxsize=4096)
+def _split_words(stem: str) -> FrozenSet[str]:
+    """
+    Split an already extracted, lowercased filename stem into its set of words.
+    
+    Results are cached per stem and returned as frozensets so cached entries
+    cannot be modified by callers.
+    """
+    if stem.isascii():
+        return frozenset(stem.translate(_ASCII_SEPARATORS).split())
+    words = _WORD_SPLIT.split(stem)
+    return frozenset(word for word in words if word)  # remove empty strings
+
 def collect_files(directory: FilePath) -> tuple[FileCollection[VideoPath], FileCollection[SubtitlePath]]:
     """
     Recursively collect video and subtitle files from a directory.
     
     This function walks through the directory tree and identifies video and subtitle
-    files based on their extensions. It skips macOS resource fork files.
+    files based on their extensions. It skips macOS resource fork files and does not
+    follow symbolic links to directories.
     
     Args:
         directory: Path-like object representing the directory to search
@@ -183,13 +208,31 @@ def collect_files(directory: FilePath) -> tuple[FileCollection[VideoPath], FileC
         video_files: list[VideoPath] = []
         subtitle_files: list[SubtitlePath] = []
 
-        for file_path in dir_path.rglob("*"):
-            if file_path.name.startswith("._"):
-                continue  # skip macOS resource fork files
-            if file_path.suffix.lower() in VIDEO_EXTENSIONS:
-                video_files.append(cast(VideoPath, file_path))
-            elif file_path.suffix.lower() in SUBTITLE_EXTENSIONS:
-                subtitle_files.append(cast(SubtitlePath, file_path))
+        # Walk the tree with an explicit stack of directories; DirEntry caches the
+        # file type from readdir, and Paths are only built for matching files
+        pending_dirs = [str(dir_path)]
+        while pending_dirs:
+            try:
+                entries = os.scandir(pending_dirs.pop())
+            except PermissionError:
+                continue  # skip unreadable subdirectories, as rglob does
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+                        continue
+                    if entry.name.startswith("._") or not entry.is_file():
+                        continue  # skip macOS resource fork files and non-files
+                    # Same rule as Path.suffix, without building a Path per entry
+                    name = entry.name
+                    dot = name.rfind(".")
+                    if dot <= 0 or dot == len(name) - 1:
+                        continue
+                    suffix = name[dot:].lower()
+                    if suffix in VIDEO_EXTENSIONS:
+                        video_files.append(cast(VideoPath, Path(entry.path)))
+                    elif suffix in SUBTITLE_EXTENSIONS:
+                        subtitle_files.append(cast(SubtitlePath, Path(entry.path)))
 
         logger.info("Collected %d video files and %d subtitle files.",
                     len(video_files), len(subtitle_files))
@@ -241,100 +284,130 @@ def find_matches(
         raise ValueError("min_similarity must be between 0 and 1")
 
     logger.debug("Finding matches with min_similarity=%f", min_similarity)
+
+    # Nothing can match when either side is empty; skip indexing and scoring
+    if not video_files or not subtitle_files:
+        return [], [], list(video_files), list(subtitle_files)
     
     # Initialize result collections with proper types
     exact_matches: list[ExactMatch] = []
     close_matches: list[CloseMatch] = []
     unmatched_videos: list[VideoPath] = []
-    subtitles_left: set[SubtitlePath] = set(subtitle_files)
+    unmatched_video_stems: List[str] = []
 
     # Phase 1: Find exact matches by comparing lowercase filenames
-    for video_file in video_files:
-        try:
+    try:
+        # Each file's lowercase stem is computed once here and reused by Phase 2.
+        # Subtitles not yet matched are keyed by path string (cheaper to hash than
+        # Path), and indexed by lowercase stem where the first subtitle seen wins
+        subtitles_left: Dict[str, Tuple[SubtitlePath, str]] = {}
+        subtitles_by_stem: Dict[str, SubtitlePath] = {}
+        for subtitle_file in subtitle_files:
+            subtitle_stem = subtitle_file.stem.lower()
+            subtitles_left.setdefault(str(subtitle_file), (subtitle_file, subtitle_stem))
+            subtitles_by_stem.setdefault(subtitle_stem, subtitle_file)
+
+        for video_file in video_files:
+            # Find subtitle with matching stem (case-insensitive)
             video_stem = video_file.stem.lower()
-            # Find first subtitle with matching stem (case-insensitive)
-            exact_subtitle = next(
-                (subtitle_file for subtitle_file in subtitle_files
-                 if subtitle_file.stem.lower() == video_stem),
-                None
-            )
+            exact_subtitle = subtitles_by_stem.get(video_stem)
             
             if exact_subtitle:
                 # Add to exact matches and remove from available subtitles
                 exact_matches.append((video_file, exact_subtitle))
-                subtitles_left.discard(exact_subtitle)
+                subtitles_left.pop(str(exact_subtitle), None)
                 logger.debug("Found exact match: `%s` -> `%s`",
-                           str(video_file), str(exact_subtitle))
+                           video_file, exact_subtitle)
             else:
                 unmatched_videos.append(video_file)
-        except Exception as e:
-            logger.warning("Error processing video file `%s`: %s",
-                         str(video_file), e)
-            continue
+                unmatched_video_stems.append(video_stem)
+    except AttributeError as e:
+        raise InvalidPathError(f"Invalid file path in match input: {e}")
 
     # Phase 2: Find close matches using word similarity and date matching
     try:
-        # Convert remaining files to sets of normalized words
-        unmatched_subtitles = list(subtitles_left)
-        unmatched_subtitle_sets: FileMapping = {
-            subtitle_file: normalize_filename(subtitle_file)
-            for subtitle_file in unmatched_subtitles
-        }
-        unmatched_video_sets: FileMapping = {
-            video_file: normalize_filename(video_file)
-            for video_file in unmatched_videos
-        }
+        # Index the remaining subtitles by position in a single pass, so the video
+        # loop below never touches Path attributes or re-parses names:
+        # - subtitles_by_word maps each word to the subtitles containing it.
+        #   Counting shared words through it computes every intersection size for
+        #   a video in one pass over its words, and subtitles sharing no word are
+        #   never visited at all
+        # - subtitles_by_date groups subtitles by embedded date, so the date boost
+        #   for a video is a set membership test
+        subtitle_paths: List[SubtitlePath] = []
+        subtitle_sizes: List[int] = []
+        subtitles_by_word: Dict[str, List[int]] = {}
+        subtitles_by_date: Dict[datetime, Set[int]] = {}
+        for index, (subtitle_file, subtitle_stem) in enumerate(subtitles_left.values()):
+            subtitle_paths.append(subtitle_file)
+            subtitle_words = _split_words(subtitle_stem)
+            subtitle_sizes.append(len(subtitle_words))
+            for word in subtitle_words:
+                subtitles_by_word.setdefault(word, []).append(index)
+            subtitle_date = extract_date(subtitle_stem)
+            if subtitle_date:
+                subtitles_by_date.setdefault(subtitle_date, set()).add(index)
+        available_subtitles = set(range(len(subtitle_paths)))
 
         # Process each unmatched video file
         remaining_videos: list[VideoPath] = []
-        for video_file, video_set in unmatched_video_sets.items():
-            best_match: Optional[SubtitlePath] = None
+        for video_file, video_stem in zip(unmatched_videos, unmatched_video_stems):
+            video_set = _split_words(video_stem)
+            video_size = len(video_set)
+            best_index = -1
             best_similarity = 0.0
             
-            # Extract date from video filename for potential matching
-            video_date = extract_date(video_file.stem)
-            
-            # Compare with each remaining subtitle
-            for subtitle_file, subtitle_set in unmatched_subtitle_sets.items():
+            # Subtitles sharing the date embedded in the video filename get a boost
+            video_date = extract_date(video_stem)
+            same_date = subtitles_by_date.get(video_date, set())
+
+            # Count the words each subtitle shares with the video
+            shared_words: Dict[int, int] = {}
+            for word in video_set:
+                for index in subtitles_by_word.get(word, ()):
+                    shared_words[index] = shared_words.get(index, 0) + 1
+
+            # Only subtitles sharing a word or the date can score above 0. Visit them
+            # in collection order so ties still go to the first subtitle
+            candidates = available_subtitles.intersection(shared_words)
+            candidates.update(available_subtitles.intersection(same_date))
+            for index in sorted(candidates):
                 # Calculate base similarity using Jaccard index
-                # similarity = |A ∩ B| / |A ∪ B|
-                intersection = video_set.intersection(subtitle_set)
-                union = video_set.union(subtitle_set)
-                similarity = len(intersection) / len(union) if union else 0.0
+                # similarity = |A ∩ B| / |A ∪ B|, where |A ∪ B| = |A| + |B| - |A ∩ B|
+                intersection = shared_words.get(index, 0)
+                union = video_size + subtitle_sizes[index] - intersection
+                similarity = intersection / union if union else 0.0
                 
                 # Apply date matching boost if dates are present and match
-                if video_date:
-                    subtitle_date = extract_date(subtitle_file.stem)
-                    if subtitle_date and video_date == subtitle_date:
-                        # Boost similarity but cap at 1.0
-                        similarity = min(1.0, similarity + DATE_SIMILARITY_BOOST)
+                if index in same_date:
+                    # Boost similarity but cap at 1.0
+                    similarity = min(1.0, similarity + DATE_SIMILARITY_BOOST)
                 
                 # Update best match if this is the highest similarity so far
                 if similarity > best_similarity:
                     best_similarity = similarity
-                    best_match = subtitle_file
+                    best_index = index
+                    # Nothing scores above 1.0 and ties keep the earlier subtitle
+                    if best_similarity >= 1.0:
+                        break
             
             # If we found a good enough match, add it to results
-            if best_match and best_similarity >= min_similarity:
-                close_matches.append((
-                    cast(VideoPath, video_file),
-                    cast(SubtitlePath, best_match),
-                    best_similarity
-                ))
-                subtitles_left.discard(best_match)
-                del unmatched_subtitle_sets[best_match]
+            if best_index >= 0 and best_similarity >= min_similarity:
+                best_match = subtitle_paths[best_index]
+                close_matches.append((video_file, best_match, best_similarity))
+                available_subtitles.remove(best_index)
                 logger.debug(
                     "Found close match: `%s` -> `%s` (similarity: %f)",
-                    str(video_file), str(best_match), best_similarity
+                    video_file, best_match, best_similarity
                 )
             else:
-                remaining_videos.append(cast(VideoPath, video_file))
+                remaining_videos.append(video_file)
 
         return (
             exact_matches,
             close_matches,
             remaining_videos,
-            list(subtitles_left)
+            [subtitle_paths[index] for index in sorted(available_subtitles)]
         )
 
     except Exception as e:
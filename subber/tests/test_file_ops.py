@@ -0,0 +1,120 @@
+"""
+Tests for the file operations module.
+"""
+
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ..core.constants import BULK_RENAME_THRESHOLD
+from ..utils import file_ops
+from ..utils.file_ops import move_unmatched_files, rename_close_matches
+
+def _select_all(message, choices):
+    """Stand-in for questionary.checkbox that selects every choice."""
+    prompt = mock.Mock()
+    prompt.ask.return_value = [choice["value"] for choice in choices]
+    return prompt
+
+def _answer(value):
+    """Stand-in for a questionary prompt factory whose prompt answers with value."""
+    return mock.Mock(return_value=mock.Mock(**{"ask.return_value": value}))
+
+class TestFileOps(unittest.TestCase):
+    """Test cases for the file operations module."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = Path("test_file_ops")
+        self.test_dir.mkdir(exist_ok=True)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.test_dir)
+
+    def test_move_same_name_does_not_overwrite(self):
+        """Test that videos sharing a name never overwrite each other when moved."""
+        videos = []
+        for season in ("Season 1", "Season 2"):
+            season_dir = self.test_dir / season
+            season_dir.mkdir()
+            video = season_dir / "episode.mkv"
+            video.write_text(season)
+            videos.append(video)
+
+        with mock.patch.object(file_ops.questionary, "checkbox", _select_all):
+            move_unmatched_files(videos, "unmatched", self.test_dir)
+
+        self.assertEqual((self.test_dir / "unmatched" / "episode.mkv").read_text(), "Season 1")
+        self.assertFalse(videos[0].exists())
+        self.assertEqual(videos[1].read_text(), "Season 2")
+
+    def _make_close_matches(self, count):
+        """Create subtitle files and return close matches pairing them with videos."""
+        close_matches = []
+        for i in range(count):
+            subtitle = self.test_dir / f"episode{i} eng.srt"
+            subtitle.touch()
+            close_matches.append((self.test_dir / f"episode{i}.mkv", subtitle, 0.5))
+        return close_matches
+
+    def _renamed(self, close_matches):
+        """Return the indexes of the close matches whose subtitle was renamed."""
+        return [
+            i for i, (video, subtitle, _) in enumerate(close_matches)
+            if (self.test_dir / f"{video.stem}.srt").exists() and not subtitle.exists()
+        ]
+
+    def test_rename_all_confirmed(self):
+        """Test that confirming the bulk prompt renames every pair without the checkbox."""
+        close_matches = self._make_close_matches(BULK_RENAME_THRESHOLD + 1)
+        confirm, checkbox = _answer(True), _answer([])
+
+        with mock.patch.object(file_ops.questionary, "confirm", confirm), \
+                mock.patch.object(file_ops.questionary, "checkbox", checkbox):
+            rename_close_matches(close_matches)
+
+        confirm.assert_called_once()
+        checkbox.assert_not_called()
+        self.assertEqual(self._renamed(close_matches), list(range(len(close_matches))))
+
+    def test_rename_all_declined(self):
+        """Test that declining the bulk prompt falls through to the checkbox."""
+        close_matches = self._make_close_matches(BULK_RENAME_THRESHOLD + 1)
+        selected = [(close_matches[2][0], close_matches[2][1])]
+        confirm, checkbox = _answer(False), _answer(selected)
+
+        with mock.patch.object(file_ops.questionary, "confirm", confirm), \
+                mock.patch.object(file_ops.questionary, "checkbox", checkbox):
+            rename_close_matches(close_matches)
+
+        checkbox.assert_called_once()
+        self.assertEqual(self._renamed(close_matches), [2])
+
+    def test_rename_all_cancelled(self):
+        """Test that cancelling the bulk prompt renames nothing and skips the checkbox."""
+        close_matches = self._make_close_matches(BULK_RENAME_THRESHOLD + 1)
+        confirm, checkbox = _answer(None), _answer([])
+
+        with mock.patch.object(file_ops.questionary, "confirm", confirm), \
+                mock.patch.object(file_ops.questionary, "checkbox", checkbox):
+            rename_close_matches(close_matches)
+
+        checkbox.assert_not_called()
+        self.assertEqual(self._renamed(close_matches), [])
+
+    def test_rename_below_threshold_skips_bulk_prompt(self):
+        """Test that short lists go straight to the checkbox."""
+        close_matches = self._make_close_matches(BULK_RENAME_THRESHOLD)
+        confirm = _answer(True)
+
+        with mock.patch.object(file_ops.questionary, "confirm", confirm), \
+                mock.patch.object(file_ops.questionary, "checkbox", _select_all):
+            rename_close_matches(close_matches)
+
+        confirm.assert_not_called()
+        self.assertEqual(self._renamed(close_matches), list(range(len(close_matches))))
+
+if __name__ == '__main__':
+    unittest.main()
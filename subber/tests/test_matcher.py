@@ -69,12 +69,28 @@ class TestMatcher(unittest.TestCase):
         # Test invalid directory
         with self.assertRaises(InvalidPathError):
             collect_files(Path("nonexistent"))
-    
+
+    def test_collect_files_nested(self):
+        """Test file collection from subdirectories."""
+        season_dir = self.test_dir / "Season 1"
+        season_dir.mkdir()
+        (season_dir / "episode1.MKV").touch()
+        (season_dir / "episode1.srt").touch()
+        (season_dir / "._episode1.srt").touch()  # macOS resource fork
+        (self.test_dir / "folder.mp4").mkdir()  # directory, not a video
+
+        videos, subs = collect_files(self.test_dir)
+
+        self.assertEqual(len(videos), 3)
+        self.assertEqual(len(subs), 3)
+        self.assertIn(season_dir / "episode1.MKV", videos)
+        self.assertNotIn(season_dir / "._episode1.srt", subs)
+
     def test_find_matches(self):
         """Test file matching."""
         videos, subs = collect_files(self.test_dir)
         
-        exact, close, unmatched = find_matches(videos, subs)
+        exact, close, unmatched, _ = find_matches(videos, subs)
         
         # Should find one exact match (video1)
         self.assertEqual(len(exact), 1)
@@ -91,5 +107,28 @@ class TestMatcher(unittest.TestCase):
         with self.assertRaises(ValueError):
             find_matches(videos, subs, min_similarity=2.0)
 
+    def test_find_matches_exact_case_insensitive(self):
+        """Test that exact matching ignores case and reuses the first subtitle per stem."""
+        videos = [Path("Movie.mkv"), Path("movie.mp4"), Path("Other.mp4")]
+        subs = [Path("MOVIE.srt"), Path("other.srt")]
+
+        exact, close, unmatched_videos, unmatched_subs = find_matches(videos, subs)
+
+        self.assertEqual(exact, [
+            (Path("Movie.mkv"), Path("MOVIE.srt")),
+            (Path("movie.mp4"), Path("MOVIE.srt")),
+            (Path("Other.mp4"), Path("other.srt")),
+        ])
+        self.assertEqual(close, [])
+        self.assertEqual(unmatched_videos, [])
+        self.assertEqual(unmatched_subs, [])
+
+    def test_find_matches_empty_side(self):
+        """Test matching when there are no videos or no subtitles."""
+        videos, subs = collect_files(self.test_dir)
+
+        self.assertEqual(find_matches(videos, []), ([], [], videos, []))
+        self.assertEqual(find_matches([], subs), ([], [], [], subs))
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
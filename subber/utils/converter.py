@@ -2,108 +2,277 @@
 Utility functions for converting video files to MP3 format using ffmpeg.
 """
 
+import os
 import subprocess
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple, Set
 import questionary
-from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
+from rich.style import Style
+from rich.progress import (
+    Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn, TimeElapsedColumn
+)
 from better_ffmpeg_progress import FfmpegProcess
 
 from ..core.constants import CONSOLE_STYLES, AUDIO_CONVERSION, MESSAGES
+from .display import console  # shared with the CLI and file operations
+
+__all__ = ["check_ffmpeg_installed", "convert_to_mp3", "batch_convert_to_mp3"]
 
-# Initialize Rich console and logger
-console = Console()
 logger = logging.getLogger(__name__)
 
-def _format_path(path: Path) -> Dict[str, Any]:
-    """Helper to format path for logging with extra parameters."""
+# Styles of the per-file progress lines, parsed once instead of on every append
+_LINE_STYLES: Dict[str, Style] = {name: Style.parse(style) for name, style in {
+    "counter": "bold blue",
+    "action": "bold",
+    "file": "cyan",
+    "success_mark": "bold green",
+    "success": "green",
+    "failure_mark": "bold red",
+    "failure": "red",
+}.items()}
+
+# ffmpeg processes started without a progress bar, so an interrupted batch can
+# stop the ones still running instead of waiting for them to finish
+_running_processes: Set[subprocess.Popen] = set()
+_running_processes_lock = threading.Lock()
+
+# Set (under _running_processes_lock) when a concurrent batch is interrupted, so
+# workers that have not started ffmpeg yet skip it instead of encoding in full
+_cancel_event = threading.Event()
+
+def _format_path(path: Path, path_type: str = 'file') -> Dict[str, Any]:
+    """Helper to format path for logging with extra parameters.
+
+    The caller states the path type, so building log metadata never touches
+    the filesystem.
+    """
     return {
         'path': str(path),
         'basename': path.name,
-        'path_type': 'file' if path.is_file() else 'directory'
+        'path_type': path_type
     }
 
+@lru_cache(maxsize=1)
 def check_ffmpeg_installed() -> bool:
-    """Check if ffmpeg is installed on the system."""
+    """Check if ffmpeg is installed on the system (probed once per run)."""
     try:
         subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
         return True
     except (subprocess.SubprocessError, FileNotFoundError):
         return False
 
-def convert_to_mp3(video_file: Path, output_dir: Path) -> bool:
+def _probe_audio_codec(video_file: Path) -> Optional[str]:
+    """Return the codec of the file's first audio stream, or None if ffprobe can't tell."""
+    try:
+        result = subprocess.run(
+            [
+                'ffprobe', '-v', 'error',
+                '-select_streams', 'a:0',
+                '-show_entries', 'stream=codec_name',
+                '-of', 'csv=p=0',
+                str(video_file)
+            ],
+            stdin=subprocess.DEVNULL, capture_output=True, text=True, check=True
+        )
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return None
+    return result.stdout.strip() or None
+
+def convert_to_mp3(video_file: Path, output_dir: Path, show_progress: bool = True) -> bool:
     """
     Convert a video file to MP3 format using ffmpeg.
     
     Args:
         video_file: Path to the video file
         output_dir: Directory for the output MP3 file
+        show_progress: Draw ffmpeg's progress bar. Disable this when several
+            conversions run at once, as the bars cannot share the terminal.
     
     Returns:
         bool: True if conversion was successful, False otherwise
     """
+    ff = None
+    ffmpeg_error = None
     try:
         output_path = output_dir / f"{video_file.stem}.mp3"
         
         if output_path.exists():
-            logger.debug(f"Skipping {video_file.name} (already exists)")
+            logger.debug("Skipping %s (already exists)", video_file.name)
             return False
 
-        logger.debug(f"Starting conversion of {video_file.name}")
+        logger.debug("Starting conversion of %s", video_file.name)
         
+        # Audio that is already MP3 is copied into the output instead of re-encoded
+        codec = _probe_audio_codec(video_file)
+        if codec is None and _cancel_event.is_set():
+            # Ctrl+C also kills ffprobe; stop here rather than fall back to a full encode
+            logger.debug("Conversion cancelled while probing %s", video_file.name)
+            return False
+        if codec == 'mp3':
+            codec_args = ['-c:a', 'copy']
+        else:
+            codec_args = ['-q:a', AUDIO_CONVERSION['FFMPEG_SETTINGS']['quality']]
+
         # Prepare ffmpeg command
         cmd = [
             'ffmpeg',
             '-i', str(video_file),
-            '-q:a', AUDIO_CONVERSION['FFMPEG_SETTINGS']['quality'],
+            *codec_args,
             '-map', AUDIO_CONVERSION['FFMPEG_SETTINGS']['map'],
+            '-threads', AUDIO_CONVERSION['FFMPEG_SETTINGS']['threads'],
             '-y',  # Overwrite output file if it exists
             str(output_path)
         ]
         
-        # Create FfmpegProcess instance with logging configuration
-        ff = FfmpegProcess(
-            cmd,
-            ffmpeg_log_level=AUDIO_CONVERSION['FFMPEG_SETTINGS']['log_level'],
-            print_stderr_new_line=True  # Print errors on new lines
-        )
-        
         try:
-            # Start the process and let better-ffmpeg-progress handle the display
-            return_code = ff.run()
+            if show_progress:
+                # Create FfmpegProcess instance with logging configuration
+                ff = FfmpegProcess(
+                    cmd,
+                    ffmpeg_log_level=AUDIO_CONVERSION['FFMPEG_SETTINGS']['log_level'],
+                    print_stderr_new_line=True  # Print errors on new lines
+                )
+                # Start the process and let better-ffmpeg-progress handle the display
+                return_code = ff.run()
+            else:
+                # Run quietly: ffmpeg writes only errors to stderr instead of its banner
+                # and running stats, and stdin is detached so concurrent ffmpegs don't
+                # read the terminal
+                quiet_cmd = [
+                    cmd[0],
+                    '-nostats',
+                    '-loglevel', AUDIO_CONVERSION['FFMPEG_SETTINGS']['log_level'],
+                    *cmd[1:]
+                ]
+                # Checked and registered under the lock: either the interrupt sweep
+                # sees this process and terminates it, or it is never started
+                with _running_processes_lock:
+                    if _cancel_event.is_set():
+                        logger.debug("Conversion cancelled before starting %s", video_file.name)
+                        return False
+                    process = subprocess.Popen(
+                        quiet_cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE, text=True
+                    )
+                    _running_processes.add(process)
+                try:
+                    _, stderr = process.communicate()
+                finally:
+                    with _running_processes_lock:
+                        _running_processes.discard(process)
+                return_code = process.returncode
+                ffmpeg_error = stderr.strip()
             
             if return_code == 0:
-                logger.debug(f"Successfully converted {video_file.name}")
+                logger.debug("Successfully converted %s", video_file.name)
                 return True
             else:
-                logger.error(f"FFmpeg process failed with return code {return_code}")
+                # Without a progress bar nothing else shows ffmpeg's errors, so the
+                # failure message carries them (appended on new lines by the CLI)
+                logger.error("FFmpeg process failed with return code %s", return_code,
+                             extra={'ffmpeg_error': ffmpeg_error} if ffmpeg_error else None)
                 # Clean up incomplete file on failure
                 if output_path.exists():
                     output_path.unlink()
-                    logger.debug(f"Cleaned up incomplete file: {output_path}")
+                    logger.debug("Cleaned up incomplete file: %s", output_path)
                 return False
             
         except KeyboardInterrupt:
             logger.debug("Conversion interrupted by user")
-            ff.terminate()
+            if ff is not None:
+                ff.terminate()
             # Clean up incomplete file on interruption
             if output_path.exists():
                 output_path.unlink()
-                logger.debug(f"Cleaned up incomplete file: {output_path}")
+                logger.debug("Cleaned up incomplete file: %s", output_path)
             return False
     
     except Exception as e:
-        logger.error(f"Failed to convert {video_file.name}", extra={'error': str(e)})
+        logger.error("Failed to convert %s", video_file.name, extra={'error': str(e)})
         # Clean up incomplete file on error
         if output_path.exists():
             output_path.unlink()
-            logger.debug(f"Cleaned up incomplete file: {output_path}")
+            logger.debug("Cleaned up incomplete file: %s", output_path)
         return False
 
+def _convert_sequentially(
+    video_files: List[Path], output_dir: Path
+) -> Iterator[Tuple[Path, bool]]:
+    """Convert files one at a time with ffmpeg's progress bar, yielding each result."""
+    total_files = len(video_files)
+    for i, video_file in enumerate(video_files, 1):
+        # Create file header with counter
+        header = Text("\n")
+        header.append(f"[{i}/{total_files}] ", style=_LINE_STYLES["counter"])
+        header.append("Converting ", style=_LINE_STYLES["action"])
+        header.append(video_file.name, style=_LINE_STYLES["file"])
+        console.print(header)
+        
+        try:
+            yield video_file, convert_to_mp3(video_file, output_dir)
+        except KeyboardInterrupt:
+            # Clean up the current file
+            output_path = output_dir / f"{video_file.stem}.mp3"
+            if output_path.exists():
+                output_path.unlink()
+                logger.debug("Cleaned up incomplete file: %s", output_path)
+            raise
+
+def _convert_concurrently(
+    video_files: List[Path], output_dir: Path, max_workers: int
+) -> Iterator[Tuple[Path, bool]]:
+    """
+    Convert files on a thread pool, yielding each result as its ffmpeg process exits.
+    
+    Threads are enough here: each worker just waits on its own ffmpeg subprocess.
+    Progress is shown as a single overall bar while the pool runs.
+    On interruption, queued files are cancelled, ffmpeg processes already
+    running are terminated (their workers then clean up the partial output) and
+    workers that have not launched ffmpeg yet skip it.
+    """
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(convert_to_mp3, video_file, output_dir, False): video_file
+                for video_file in video_files
+            }
+            try:
+                # One live display for the whole pool: an overall bar that advances as
+                # each file finishes. The caller prints the result lines on the same
+                # console, so they appear above the bar
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    MofNCompleteColumn(),
+                    TimeElapsedColumn(),
+                    console=console,
+                    transient=True
+                ) as progress:
+                    convert_task = progress.add_task(
+                        f"Converting with {max_workers} ffmpeg processes", total=len(futures)
+                    )
+                    for future in as_completed(futures):
+                        yield futures[future], future.result()
+                        progress.advance(convert_task)
+            finally:
+                for future in futures:
+                    future.cancel()
+                with _running_processes_lock:
+                    _cancel_event.set()
+                    for process in _running_processes:
+                        process.terminate()
+    finally:
+        # All workers have finished once the executor is shut down
+        _cancel_event.clear()
+
 def batch_convert_to_mp3(video_files: List[Path], output_dir: Optional[Path] = None) -> int:
     """
     Convert a batch of video files to MP3 format.
@@ -125,29 +294,32 @@ def batch_convert_to_mp3(video_files: List[Path], output_dir: Optional[Path] = N
         
     # Create output directory if it doesn't exist
     output_dir.mkdir(exist_ok=True)
-    logger.debug("Created/verified output directory", 
-                extra=_format_path(output_dir))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Created/verified output directory", 
+                    extra=_format_path(output_dir, 'directory'))
 
-    # Build choices for questionary
-    choices = []
-    # Add "Select All" option at the top
-    choices.append({
-        "name": "Select All",
-        "value": "ALL",
-        "checked": False
-    })
-    
-    # Add file choices
-    file_choices = []
+    # Read the output directory once instead of a stat per video; convert_to_mp3
+    # still checks each output right before converting it. Names are casefolded
+    # so outputs differing only in case are not missed on case-insensitive
+    # filesystems (macOS, Windows)
+    with os.scandir(output_dir) as entries:
+        existing_outputs = {entry.name.casefold() for entry in entries}
+
+    # Collect the videos that still need converting
+    pending_files: List[Path] = []
     for video_file in video_files:
-        output_path = output_dir / f"{video_file.stem}.mp3"
-        if output_path.exists():
-            logger.debug("Output file already exists, skipping", 
-                        extra={'output_file': str(output_path)})
+        output_name = f"{video_file.stem}.mp3"
+        # A casefolded hit is confirmed with exists(), which answers with the
+        # filesystem's own case rules; a miss means no such output at all
+        if (output_name.casefold() in existing_outputs
+                and (output_dir / output_name).exists()):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Output file already exists, skipping", 
+                            extra={'output_file': str(output_dir / output_name)})
             continue
-        file_choices.append({"name": video_file.name, "value": video_file})
+        pending_files.append(video_file)
 
-    if not file_choices:
+    if not pending_files:
         logger.debug("No files available for conversion")
         console.print(Panel(
             "No files available for conversion.",
@@ -157,9 +329,12 @@ def batch_convert_to_mp3(video_files: List[Path], output_dir: Optional[Path] = N
         ))
         return 0
 
-    choices.extend(file_choices)
     logger.debug("Found files available for conversion", 
-                extra={'file_count': len(file_choices)})
+                extra={'file_count': len(pending_files)})
+
+    # Build choices for questionary, with a "Select All" option at the top
+    choices = [{"name": "Select All", "value": "ALL", "checked": False}]
+    choices.extend({"name": video_file.name, "value": video_file} for video_file in pending_files)
 
     try:
         selected = questionary.checkbox(
@@ -172,9 +347,8 @@ def batch_convert_to_mp3(video_files: List[Path], output_dir: Optional[Path] = N
             return 0
             
         # Handle "Select All" option
-        files_to_convert = []
         if "ALL" in selected:
-            files_to_convert = [choice["value"] for choice in file_choices]
+            files_to_convert = pending_files
             logger.debug("Selected all files for conversion", 
                         extra={'file_count': len(files_to_convert)})
         else:
@@ -182,9 +356,10 @@ def batch_convert_to_mp3(video_files: List[Path], output_dir: Optional[Path] = N
             logger.debug("Selected specific files for conversion", 
                         extra={'file_count': len(files_to_convert)})
             
-        # Convert files one by one
+        # Convert files, running several ffmpeg processes at once when possible
         converted_count = 0
         total_files = len(files_to_convert)
+        max_workers = min(AUDIO_CONVERSION['MAX_WORKERS'] or os.cpu_count() or 1, total_files)
         
         # Create header panel
         console.print(Panel(
@@ -194,51 +369,41 @@ def batch_convert_to_mp3(video_files: List[Path], output_dir: Optional[Path] = N
             title_align="left"
         ))
         
-        for i, video_file in enumerate(files_to_convert, 1):
-            # Create file header with counter
-            header = Text()
-            header.append(f"[{i}/{total_files}] ", style="bold blue")
-            header.append("Converting ", style="bold")
-            header.append(video_file.name, style="cyan")
-            console.print(f"\n{header}")
-            
-            try:
-                if convert_to_mp3(video_file, output_dir):
+        if max_workers > 1:
+            results = _convert_concurrently(files_to_convert, output_dir, max_workers)
+        else:
+            results = _convert_sequentially(files_to_convert, output_dir)
+        
+        try:
+            for i, (video_file, success) in enumerate(results, 1):
+                # Concurrent results arrive out of order, so number them as they finish
+                msg = Text(f"[{i}/{total_files}] ", style=_LINE_STYLES["counter"]) if max_workers > 1 else Text()
+                if success:
                     converted_count += 1
                     # Success message
-                    msg = Text("✓ ", style="bold green")
-                    msg.append("Converted ", style="green")
-                    msg.append(video_file.name, style="cyan")
-                    console.print(msg)
+                    msg.append("✓ ", style=_LINE_STYLES["success_mark"])
+                    msg.append("Converted ", style=_LINE_STYLES["success"])
                 else:
-                    # Error message
-                    msg = Text("✗ ", style="bold red")
-                    msg.append("Failed to convert ", style="red")
-                    msg.append(video_file.name, style="cyan")
-                    console.print(msg)
-                    # Continue with next file on error
-                    continue
+                    # Error message; continue with next file
+                    msg.append("✗ ", style=_LINE_STYLES["failure_mark"])
+                    msg.append("Failed to convert ", style=_LINE_STYLES["failure"])
+                msg.append(video_file.name, style=_LINE_STYLES["file"])
+                console.print(msg)
                     
-            except KeyboardInterrupt:
-                # Clean up the current file
-                output_path = output_dir / f"{video_file.stem}.mp3"
-                if output_path.exists():
-                    output_path.unlink()
-                    logger.debug(f"Cleaned up incomplete file: {output_path}")
-                
-                # Show cancellation message
-                console.print(Panel(
-                    Text.assemble(
-                        (f"{MESSAGES['OPERATION_CANCELLED']}\n", "yellow"),
-                        ("Converted ", "bold"),
-                        (f"{converted_count}/{total_files}", "bold yellow"),
-                        " files before cancellation"
-                    ),
-                    border_style="yellow",
-                    title="Cancelled",
-                    title_align="left"
-                ))
-                return converted_count
+        except KeyboardInterrupt:
+            # Show cancellation message
+            console.print(Panel(
+                Text.assemble(
+                    (f"{MESSAGES['OPERATION_CANCELLED']}\n", "yellow"),
+                    ("Converted ", "bold"),
+                    (f"{converted_count}/{total_files}", "bold yellow"),
+                    " files before cancellation"
+                ),
+                border_style="yellow",
+                title="Cancelled",
+                title_align="left"
+            ))
+            return converted_count
         
         # Print summary panel only if all files were processed
         logger.debug("Conversion complete", 
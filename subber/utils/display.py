@@ -3,18 +3,44 @@ Display utilities for formatting and presenting results.
 """
 
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
 from rich.table import Table
+from rich.style import Style
 from tabulate import tabulate
 import logging
 
-from ..core.constants import PANEL_SETTINGS, TABLE_SETTINGS, MESSAGES
-
-# Initialize Rich console
-console = Console()
+from ..core.constants import PANEL_SETTINGS, TABLE_SETTINGS, MESSAGES, CONSOLE_STYLES
+
+# Rich console shared by the CLI, its log handler and every helper module.
+# Status output is styled explicitly, so skip Rich's per-print regex highlighting
+console = Console(highlight=False, emoji=False)
+
+# CONSOLE_STYLES parsed once into Rich Style objects, so prints skip style parsing
+STYLES: Dict[str, Style] = {name: Style.parse(style) for name, style in CONSOLE_STYLES.items()}
+
+# TABLE_SETTINGS with border and header styles parsed once, reused by every table
+_TABLE_SETTINGS: Dict[str, Dict[str, Any]] = {
+    name: {
+        **settings,
+        "border_style": Style.parse(settings["border_style"]),
+        "header_style": Style.parse(settings["header_style"]),
+    }
+    for name, settings in TABLE_SETTINGS.items()
+}
+
+# Panels shown in table mode for empty sections never change, so build them once
+_EMPTY_PANELS: Dict[str, Panel] = {
+    section: Panel(MESSAGES[message], **PANEL_SETTINGS[section])
+    for section, message in (
+        ("EXACT_MATCHES", "NO_EXACT_MATCHES"),
+        ("CLOSE_MATCHES", "NO_CLOSE_MATCHES"),
+        ("UNMATCHED_VIDEOS", "ALL_VIDEOS_MATCHED"),
+        ("UNMATCHED_SUBTITLES", "ALL_SUBS_MATCHED"),
+    )
+}
 
 def show_ascii_art():
     """
@@ -29,6 +55,36 @@ def show_ascii_art():
     # Print art in cyan panel
     console.print(Panel(art, border_style="cyan", title="subber", expand=False))
 
+def _iter_output_lines(
+    exact_lines: List[str],
+    close_lines: List[str],
+    unmatched_video_lines: List[str],
+    unmatched_subtitle_lines: List[str]
+) -> Iterator[str]:
+    """Yield the lines of the plain-text results written to an output file."""
+    yield "Exact Matches:"
+    yield from exact_lines or ("No exact matches found.",)
+
+    yield "\nClose Matches:"
+    yield from close_lines or ("No close matches found.",)
+
+    yield "\nUnmatched Video Files:"
+    yield from unmatched_video_lines or ("All video files have matching subtitles.",)
+
+    yield "\nUnmatched Subtitle Files:"
+    yield from unmatched_subtitle_lines or ("All subtitle files have matching videos.",)
+
+def _write_output_file(output_file: str, lines: Iterable[str]) -> None:
+    """Write result lines to the output file and report the outcome."""
+    try:
+        # Stream lines straight into the file instead of joining one big string
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.writelines(f"{line}\n" for line in lines)
+        console.print(Panel(f"Results written to {output_file}", border_style="green", title="Success", title_align="left"))
+    except Exception as e:
+        logging.error("Error writing to file %s: %s", output_file, e)
+        console.print(Panel(f"Error writing to file {output_file}: {e}", border_style="red", title="Error", title_align="left"))
+
 def display_results(
     exact_matches: List[Tuple[Path, Path]],
     close_matches: List[Tuple[Path, Path, float]],
@@ -43,8 +99,23 @@ def display_results(
     Display the results either as plain text or using tabulate for nice table formatting.
     Also optionally write to an output file.
     """
+    # Nothing was found at all: one status panel instead of four empty sections
+    if not (exact_matches or close_matches or unmatched_videos or unmatched_subtitles):
+        console.print(Panel(
+            MESSAGES["NO_FILES_FOUND"],
+            border_style=CONSOLE_STYLES["warning"],
+            title="Status",
+            title_align="left"
+        ))
+        if output_file:
+            _write_output_file(output_file, (MESSAGES["NO_FILES_FOUND"],))
+        return
+
+    # Resolve the base directory once rather than once per displayed path
+    base_directory = directory.resolve()
+
     def fmt_path(p: Path) -> str:
-        return str(p.resolve()) if show_full_path else str(p.relative_to(directory.resolve()))
+        return str(p.resolve()) if show_full_path else str(p.relative_to(base_directory))
 
     # Prepare text lines for each section
     exact_section = []
@@ -65,51 +136,50 @@ def display_results(
         for subtitle_file in unmatched_subtitles:
             unmatched_subtitle_section.append((fmt_path(subtitle_file),))
 
+    # Plain-text rows, formatted once and shared by the panels and the output file
+    if no_table or output_file:
+        exact_lines = [
+            f"{video_file} --> {subtitle_file}"
+            for video_file, subtitle_file in exact_section
+        ]
+        close_lines = [
+            f"{video_file} --> {subtitle_file} (Similarity: {sim})"
+            for video_file, subtitle_file, sim in close_section
+        ]
+        unmatched_video_lines = [video_file for (video_file,) in unmatched_video_section]
+        unmatched_subtitle_lines = [subtitle_file for (subtitle_file,) in unmatched_subtitle_section]
+
     # If no_table, print plain text
     if no_table:
-        # Exact matches section
-        exact_content = Text()
-        if exact_section:
-            for video_file, subtitle_file in exact_section:
-                exact_content.append(f"{video_file} --> {subtitle_file}\n")
-        else:
-            exact_content.append(f"{MESSAGES['NO_EXACT_MATCHES']}\n")
+        # Each panel body is joined into one string and wrapped in a single Text,
+        # which (unlike a plain str) is not parsed as markup
+        exact_content = Text("".join(
+            f"{line}\n" for line in exact_lines
+        ) or f"{MESSAGES['NO_EXACT_MATCHES']}\n")
         console.print(Panel(
             exact_content,
             **PANEL_SETTINGS["EXACT_MATCHES"]
         ))
 
-        # Close matches section
-        close_content = Text()
-        if close_section:
-            for video_file, subtitle_file, sim in close_section:
-                close_content.append(f"{video_file} --> {subtitle_file} (Similarity: {sim})\n")
-        else:
-            close_content.append(f"{MESSAGES['NO_CLOSE_MATCHES']}\n")
+        close_content = Text("".join(
+            f"{line}\n" for line in close_lines
+        ) or f"{MESSAGES['NO_CLOSE_MATCHES']}\n")
         console.print(Panel(
             close_content,
             **PANEL_SETTINGS["CLOSE_MATCHES"]
         ))
 
-        # Unmatched video files section
-        unmatched_video_content = Text()
-        if unmatched_video_section:
-            for (video_file,) in unmatched_video_section:
-                unmatched_video_content.append(f"{video_file}\n")
-        else:
-            unmatched_video_content.append(f"{MESSAGES['ALL_VIDEOS_MATCHED']}\n")
+        unmatched_video_content = Text("".join(
+            f"{line}\n" for line in unmatched_video_lines
+        ) or f"{MESSAGES['ALL_VIDEOS_MATCHED']}\n")
         console.print(Panel(
             unmatched_video_content,
             **PANEL_SETTINGS["UNMATCHED_VIDEOS"]
         ))
 
-        # Unmatched subtitle files section
-        unmatched_subtitle_content = Text()
-        if unmatched_subtitle_section:
-            for (subtitle_file,) in unmatched_subtitle_section:
-                unmatched_subtitle_content.append(f"{subtitle_file}\n")
-        else:
-            unmatched_subtitle_content.append(f"{MESSAGES['ALL_SUBS_MATCHED']}\n")
+        unmatched_subtitle_content = Text("".join(
+            f"{line}\n" for line in unmatched_subtitle_lines
+        ) or f"{MESSAGES['ALL_SUBS_MATCHED']}\n")
         console.print(Panel(
             unmatched_subtitle_content,
             **PANEL_SETTINGS["UNMATCHED_SUBTITLES"]
@@ -118,21 +188,18 @@ def display_results(
         # Use Rich tables with borders
         # Exact matches table
         if exact_section:
-            table = Table(**TABLE_SETTINGS["EXACT_MATCHES"])
+            table = Table(**_TABLE_SETTINGS["EXACT_MATCHES"])
             table.add_column("Video File")
             table.add_column("Subtitle File")
             for video_file, subtitle_file in exact_section:
                 table.add_row(video_file, subtitle_file)
             console.print(table)
         else:
-            console.print(Panel(
-                MESSAGES["NO_EXACT_MATCHES"],
-                **PANEL_SETTINGS["EXACT_MATCHES"]
-            ))
+            console.print(_EMPTY_PANELS["EXACT_MATCHES"])
 
         # Close matches table
         if close_section:
-            table = Table(**TABLE_SETTINGS["CLOSE_MATCHES"])
+            table = Table(**_TABLE_SETTINGS["CLOSE_MATCHES"])
             table.add_column("Video File")
             table.add_column("Subtitle File")
             table.add_column("Similarity")
@@ -140,106 +207,31 @@ def display_results(
                 table.add_row(video_file, subtitle_file, sim)
             console.print(table)
         else:
-            console.print(Panel(
-                MESSAGES["NO_CLOSE_MATCHES"],
-                **PANEL_SETTINGS["CLOSE_MATCHES"]
-            ))
+            console.print(_EMPTY_PANELS["CLOSE_MATCHES"])
 
         # Unmatched video files table
         if unmatched_video_section:
-            table = Table(**TABLE_SETTINGS["UNMATCHED_VIDEOS"])
+            table = Table(**_TABLE_SETTINGS["UNMATCHED_VIDEOS"])
             table.add_column("Video File")
             for (video_file,) in unmatched_video_section:
                 table.add_row(video_file)
             console.print(table)
         else:
-            console.print(Panel(
-                MESSAGES["ALL_VIDEOS_MATCHED"],
-                **PANEL_SETTINGS["UNMATCHED_VIDEOS"]
-            ))
+            console.print(_EMPTY_PANELS["UNMATCHED_VIDEOS"])
 
         # Unmatched subtitle files table
         if unmatched_subtitle_section:
-            table = Table(**TABLE_SETTINGS["UNMATCHED_SUBTITLES"])
+            table = Table(**_TABLE_SETTINGS["UNMATCHED_SUBTITLES"])
             table.add_column("Subtitle File")
             for (subtitle_file,) in unmatched_subtitle_section:
                 table.add_row(subtitle_file)
             console.print(table)
         else:
-            console.print(Panel(
-                MESSAGES["ALL_SUBS_MATCHED"],
-                **PANEL_SETTINGS["UNMATCHED_SUBTITLES"]
-            ))
-
-    # Write to output file if specified
-    if output_file:
-        all_text = []
-        all_text.append("\nExact Matches:")
-        if exact_section:
-            for video_file, subtitle_file in exact_section:
-                all_text.append(f"{video_file} --> {subtitle_file}")
-        else:
-            all_text.append("No exact matches found.")
-
-        all_text.append("\nClose Matches:")
-        if close_section:
-            for video_file, subtitle_file, sim in close_section:
-                all_text.append(f"{video_file} --> {subtitle_file} (Similarity: {sim})")
-        else:
-            all_text.append("No close matches found.")
-
-        all_text.append("\nUnmatched Video Files:")
-        if unmatched_video_section:
-            for (video_file,) in unmatched_video_section:
-                all_text.append(video_file)
-        else:
-            all_text.append("All video files have matching subtitles.")
-
-        all_text.append("\nUnmatched Subtitle Files:")
-        if unmatched_subtitle_section:
-            for (subtitle_file,) in unmatched_subtitle_section:
-                all_text.append(subtitle_file)
-        else:
-            all_text.append("All subtitle files have matching videos.")
-
-        with open(output_file, 'w') as f:
-            f.write('\n'.join(all_text))
+            console.print(_EMPTY_PANELS["UNMATCHED_SUBTITLES"])
 
     # If output_file is provided, save text-based results to file
     if output_file:
-        all_text = []
-        all_text.append("Exact Matches:")
-        if exact_section:
-            for video_file, subtitle_file in exact_section:
-                all_text.append(f"{video_file} --> {subtitle_file}")
-        else:
-            all_text.append("No exact matches found.")
-
-        all_text.append("\nClose Matches:")
-        if close_section:
-            for video_file, subtitle_file, sim in close_section:
-                all_text.append(f"{video_file} --> {subtitle_file} (Similarity: {sim})")
-        else:
-            all_text.append("No close matches found.")
-
-        all_text.append("\nUnmatched Video Files:")
-        if unmatched_video_section:
-            for (video_file,) in unmatched_video_section:
-                all_text.append(video_file)
-        else:
-            all_text.append("All video files have matching subtitles.")
-
-        all_text.append("\nUnmatched Subtitle Files:")
-        if unmatched_subtitle_section:
-            for (subtitle_file,) in unmatched_subtitle_section:
-                all_text.append(subtitle_file)
-        else:
-            all_text.append("All subtitle files have matching videos.")
-
-        try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write("\n".join(all_text) + "\n")
-            console.print(Panel(f"Results written to {output_file}", border_style="green", title="Success", title_align="left"))
-        except Exception as e:
-            logging.error("Error writing to file %s: %s", output_file, e)
-            console.print(Panel(f"Error writing to file {output_file}: {e}", border_style="red", title="Error", title_align="left")) 
\ No newline at end of file
+        _write_output_file(output_file, _iter_output_lines(
+            exact_lines, close_lines,
+            unmatched_video_lines, unmatched_subtitle_lines
+        ))
@@ -2,37 +2,50 @@
 File operation utilities for renaming and moving files.
 """
 
+import errno
 import logging
+import os
 import shutil
 from pathlib import Path
 from typing import List, Tuple
 import questionary
-from rich.console import Console
-from rich.text import Text
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.style import Style
 
-from ..core.constants import CONSOLE_STYLES
+from ..core.constants import BULK_RENAME_THRESHOLD, CONSOLE_STYLES
+from .display import console, STYLES
 
-# Initialize Rich console and logger
-console = Console()
 logger = logging.getLogger(__name__)
 
 class FileOperationError(Exception):
     """Base exception for file operations."""
     pass
 
-def create_rich_label(video_file: Path, subtitle_file: Path, similarity: float) -> Text:
-    """Create a formatted label for file pairs using Rich's Text class."""
-    label = Text()
-    label.append(video_file.name, style=CONSOLE_STYLES["info"])
-    label.append(" -> ")
-    label.append(subtitle_file.name, style=CONSOLE_STYLES["success"])
-    label.append(" (Similarity: ")
-    label.append(f"{similarity:.2f}", style=CONSOLE_STYLES["dim"])
-    label.append(")")
-    return label
+# Header style for the rename/move result tables, parsed once
+_TABLE_HEADER_STYLE = Style.parse(f"bold {CONSOLE_STYLES['info']}")
+
+def _create_operation_table(title: str, first_column: str, second_column: str) -> Table:
+    """Create a rename/move result table with its three styled columns."""
+    table = Table(
+        title=title,
+        border_style=STYLES["info"],
+        header_style=_TABLE_HEADER_STYLE
+    )
+    table.add_column(first_column, style=STYLES["info"])
+    table.add_column(second_column, style=STYLES["success"])
+    table.add_column("Status", style=STYLES["warning"])
+    return table
+
+def create_rich_label(video_file: Path, subtitle_file: Path, similarity: float) -> str:
+    """
+    Create the prompt label for a file pair.
+
+    questionary displays choice names as plain text, so the label is built as a
+    plain string rather than as a styled Rich Text.
+    """
+    return f"{video_file.name} -> {subtitle_file.name} (Similarity: {similarity:.2f})"
 
 def rename_close_matches(
     close_matches: List[Tuple[Path, Path, float]]
@@ -51,51 +64,39 @@ def rename_close_matches(
         return
 
     try:
-        # Build choices for questionary
-        choices = []
-        # Add "Select All" option at the top
-        choices.append({
-            "name": "Select All",
-            "value": "ALL",
-            "checked": False
-        })
-        
-        # Add file choices
-        file_choices = []
-        for (video_file, subtitle_file, sim) in close_matches:
-            label = create_rich_label(video_file, subtitle_file, sim)
-            file_choices.append({"name": str(label), "value": (video_file, subtitle_file)})
-
-        choices.extend(file_choices)
-        logger.debug(f"[blue]Found[/blue] [cyan]{len(file_choices)}[/cyan] [blue]pairs available for renaming[/blue]")
+        logger.debug("[blue]Found[/blue] [cyan]%d[/cyan] [blue]pairs available for renaming[/blue]", len(close_matches))
 
-        selected = questionary.checkbox(
-            "Select which pairs you want to rename:",
-            choices=choices
-        ).ask()
-
-        # Handle selection
-        if not selected:
-            logger.debug("[yellow]No pairs selected for renaming[/yellow]")
-            console.print(Panel(
-                "No pairs selected for renaming.",
-                border_style=CONSOLE_STYLES["warning"],
-                title="Status",
-                title_align="left"
-            ))
-            return
+        # For long lists, offer renaming everything before showing the checkbox
+        rename_all = False
+        if len(close_matches) > BULK_RENAME_THRESHOLD:
+            rename_all = questionary.confirm(
+                f"Rename all {len(close_matches)} close matches?",
+                default=False
+            ).ask()
 
-        # If "Select All" is chosen, use all file pairs
-        selected_pairs = []
-        if "ALL" in selected:
-            selected_pairs = [choice["value"] for choice in file_choices]
-            logger.debug("[blue]Selected all pairs for renaming[/blue]")
+        if rename_all:
+            selected_pairs = [
+                (video_file, subtitle_file) for (video_file, subtitle_file, _) in close_matches
+            ]
+        elif rename_all is None:
+            # ask() returns None when the prompt is cancelled with Ctrl+C
+            selected_pairs = None
         else:
-            selected_pairs = selected
-            logger.debug(f"[blue]Selected[/blue] [cyan]{len(selected_pairs)}[/cyan] [blue]pairs for renaming[/blue]")
+            # Build choices for questionary; its checkbox already toggles all
+            # choices with <a>, so no separate "Select All" entry is needed
+            choices = [
+                {"name": create_rich_label(video_file, subtitle_file, sim), "value": (video_file, subtitle_file)}
+                for (video_file, subtitle_file, sim) in close_matches
+            ]
 
+            selected_pairs = questionary.checkbox(
+                "Select which pairs you want to rename:",
+                choices=choices
+            ).ask()
+
+        # Handle selection
         if not selected_pairs:
-            logger.debug("[yellow]No pairs selected after processing selection[/yellow]")
+            logger.debug("[yellow]No pairs selected for renaming[/yellow]")
             console.print(Panel(
                 "No pairs selected for renaming.",
                 border_style=CONSOLE_STYLES["warning"],
@@ -103,16 +104,10 @@ def rename_close_matches(
                 title_align="left"
             ))
             return
+        logger.debug("[blue]Selected[/blue] [cyan]%d[/cyan] [blue]pairs for renaming[/blue]", len(selected_pairs))
 
         # Create a table for rename operations
-        table = Table(
-            title="Rename Operations",
-            border_style=CONSOLE_STYLES["info"],
-            header_style=f"bold {CONSOLE_STYLES['info']}"
-        )
-        table.add_column("Source", style=CONSOLE_STYLES["info"])
-        table.add_column("Target", style=CONSOLE_STYLES["success"])
-        table.add_column("Status", style=CONSOLE_STYLES["warning"])
+        table = _create_operation_table("Rename Operations", "Source", "Target")
 
         # Show progress during rename operations
         with Progress(
@@ -124,37 +119,52 @@ def rename_close_matches(
             
             # Perform rename on selected pairs
             for (video_file, subtitle_file) in selected_pairs:
-                new_subtitle = subtitle_file.with_name(video_file.stem + subtitle_file.suffix)
-                logger.debug(f"[blue]Processing rename:[/blue] [cyan]`{str(subtitle_file)}`[/cyan] [blue]->[/blue] [cyan]`{str(new_subtitle)}`[/cyan]")
+                # Work on plain strings; each path is needed as str for the table anyway
+                new_name = video_file.stem + subtitle_file.suffix
+                source = str(subtitle_file)
+                new_subtitle = os.path.join(os.path.dirname(source), new_name)
+                logger.debug("[blue]Processing rename:[/blue] [cyan]`%s`[/cyan] [blue]->[/blue] [cyan]`%s`[/cyan]",
+                             source, new_subtitle)
                 
                 progress.update(
                     rename_task,
-                    description=f"Renaming {subtitle_file.name} -> {new_subtitle.name}"
+                    description=f"Renaming {subtitle_file.name} -> {new_name}"
                 )
                 
-                if new_subtitle.exists():
-                    logger.debug(f"[yellow]Target file already exists:[/yellow] [cyan]`{str(new_subtitle)}`[/cyan]")
+                # rename() silently replaces an existing target on POSIX, so the
+                # existence check has to stay; lexists also catches dangling symlinks
+                if os.path.lexists(new_subtitle):
+                    logger.debug("[yellow]Target file already exists:[/yellow] [cyan]`%s`[/cyan]", new_subtitle)
                     table.add_row(
-                        str(subtitle_file),
-                        str(new_subtitle),
+                        source,
+                        new_subtitle,
                         "❌ File exists"
                     )
                     continue
                 
                 try:
-                    subtitle_file.rename(new_subtitle)
-                    logger.debug(f"[green]Successfully renamed:[/green] [cyan]`{str(subtitle_file)}`[/cyan] [green]->[/green] [cyan]`{str(new_subtitle)}`[/cyan]")
+                    os.rename(source, new_subtitle)
+                    logger.debug("[green]Successfully renamed:[/green] [cyan]`%s`[/cyan] [green]->[/green] [cyan]`%s`[/cyan]",
+                                 source, new_subtitle)
                     table.add_row(
-                        str(subtitle_file),
-                        str(new_subtitle),
+                        source,
+                        new_subtitle,
                         "✓ Renamed"
                     )
+                except FileExistsError:
+                    # Target created after the check (Windows raises instead of replacing)
+                    logger.debug("[yellow]Target file already exists:[/yellow] [cyan]`%s`[/cyan]", new_subtitle)
+                    table.add_row(
+                        source,
+                        new_subtitle,
+                        "❌ File exists"
+                    )
                 except Exception as e:
-                    logger.error(f"[red]Error renaming file[/red] [cyan]`{str(subtitle_file)}`[/cyan][red]:[/red] {e}")
-                    logger.debug(f"[red]Rename error details:[/red] {str(e)}")
+                    logger.error("[red]Error renaming file[/red] [cyan]`%s`[/cyan][red]:[/red] %s", source, e)
+                    logger.debug("[red]Rename error details:[/red] %s", e)
                     table.add_row(
-                        str(subtitle_file),
-                        str(new_subtitle),
+                        source,
+                        new_subtitle,
                         f"❌ Error: {e}"
                     )
                 finally:
@@ -164,8 +174,8 @@ def rename_close_matches(
         console.print(table)
         
     except Exception as e:
-        logger.error(f"[red]Error during rename operation:[/red] {e}")
-        logger.debug(f"[red]Rename operation error details:[/red] {str(e)}")
+        logger.error("[red]Error during rename operation:[/red] %s", e)
+        logger.debug("[red]Rename operation error details:[/red] %s", e)
         raise FileOperationError(f"Error during rename operation: {e}")
 
 def move_unmatched_files(
@@ -201,17 +211,45 @@ def move_unmatched_files(
     try:
         dest_path = base_directory.joinpath(destination_folder)
         dest_path.mkdir(exist_ok=True)
-        logger.debug(f"[blue]Created/verified destination directory:[/blue] [cyan]`{str(dest_path)}`[/cyan]")
+        logger.debug("[blue]Created/verified destination directory:[/blue] [cyan]`%s`[/cyan]", dest_path)
+
+        # Target paths as plain strings, built once and reused by the prompt and the loop
+        destination = str(dest_path)
+        moves = [
+            (video_file, os.path.join(destination, video_file.name))
+            for video_file in unmatched_videos
+        ]
+
+        # Ask once which files to move; files whose target already exists are
+        # reported below but never offered. This list only builds the prompt:
+        # the loop checks every target again right before moving
+        movable_videos = [
+            video_file for video_file, target_file in moves
+            if not os.path.lexists(target_file)
+        ]
+        selected_videos = set()
+        if movable_videos:
+            selected = questionary.checkbox(
+                f"Select which files to move to {dest_path}:",
+                choices=[
+                    {"name": video_file.name, "value": video_file, "checked": True}
+                    for video_file in movable_videos
+                ]
+            ).ask()
+
+            if not selected:
+                logger.debug("[yellow]No files selected for moving[/yellow]")
+                console.print(Panel(
+                    "No files selected for moving.",
+                    border_style=CONSOLE_STYLES["warning"],
+                    title="Status",
+                    title_align="left"
+                ))
+                return
+            selected_videos = set(selected)
 
         # Create a table for move operations
-        table = Table(
-            title="Move Operations",
-            border_style=CONSOLE_STYLES["info"],
-            header_style=f"bold {CONSOLE_STYLES['info']}"
-        )
-        table.add_column("File", style=CONSOLE_STYLES["info"])
-        table.add_column("Destination", style=CONSOLE_STYLES["success"])
-        table.add_column("Status", style=CONSOLE_STYLES["warning"])
+        table = _create_operation_table("Move Operations", "File", "Destination")
 
         with Progress(
             SpinnerColumn(),
@@ -220,47 +258,56 @@ def move_unmatched_files(
         ) as progress:
             move_task = progress.add_task("Moving files...", total=len(unmatched_videos))
             
-            for video_file in unmatched_videos:
-                target_file = dest_path.joinpath(video_file.name)
-                logger.debug(f"[blue]Processing move:[/blue] [cyan]`{str(video_file)}`[/cyan] [blue]->[/blue] [cyan]`{str(target_file)}`[/cyan]")
+            for video_file, target_file in moves:
+                logger.debug("[blue]Processing move:[/blue] [cyan]`%s`[/cyan] [blue]->[/blue] [cyan]`%s`[/cyan]",
+                             video_file, target_file)
                 
                 progress.update(
                     move_task,
                     description=f"Moving {video_file.name}"
                 )
                 
-                if target_file.exists():
-                    logger.debug(f"[yellow]Target file already exists:[/yellow] [cyan]`{str(target_file)}`[/cyan]")
+                # Checked again per file: unmatched videos from different
+                # subdirectories can share a name and thus a target
+                if os.path.lexists(target_file):
+                    logger.debug("[yellow]Target file already exists:[/yellow] [cyan]`%s`[/cyan]", target_file)
                     table.add_row(
-                        str(video_file.name),
-                        str(dest_path),
+                        video_file.name,
+                        destination,
                         "❌ File exists"
                     )
                     continue
 
-                answer = questionary.confirm(f"Move {video_file.name} to {dest_path}?").ask()
-                if answer:
+                if video_file in selected_videos:
                     try:
-                        shutil.move(str(video_file), str(target_file))
-                        logger.debug(f"[green]Successfully moved:[/green] [cyan]`{str(video_file)}`[/cyan] [green]->[/green] [cyan]`{str(target_file)}`[/cyan]")
+                        # Destination is usually on the same filesystem, so try a
+                        # plain rename before shutil.move's copy-and-delete fallback
+                        try:
+                            os.rename(video_file, target_file)
+                        except OSError as e:
+                            if e.errno != errno.EXDEV:
+                                raise
+                            shutil.move(str(video_file), target_file)
+                        logger.debug("[green]Successfully moved:[/green] [cyan]`%s`[/cyan] [green]->[/green] [cyan]`%s`[/cyan]",
+                                     video_file, target_file)
                         table.add_row(
-                            str(video_file.name),
-                            str(dest_path),
+                            video_file.name,
+                            destination,
                             "✓ Moved"
                         )
                     except Exception as e:
-                        logger.error(f"[red]Error moving file[/red] [cyan]`{str(video_file)}`[/cyan][red]:[/red] {e}")
-                        logger.debug(f"[red]Move error details:[/red] {str(e)}")
+                        logger.error("[red]Error moving file[/red] [cyan]`%s`[/cyan][red]:[/red] %s", video_file, e)
+                        logger.debug("[red]Move error details:[/red] %s", e)
                         table.add_row(
-                            str(video_file.name),
-                            str(dest_path),
+                            video_file.name,
+                            destination,
                             f"❌ Error: {e}"
                         )
                 else:
-                    logger.debug(f"[yellow]User skipped moving:[/yellow] [cyan]`{str(video_file)}`[/cyan]")
+                    logger.debug("[yellow]User skipped moving:[/yellow] [cyan]`%s`[/cyan]", video_file)
                     table.add_row(
-                        str(video_file.name),
-                        str(dest_path),
+                        video_file.name,
+                        destination,
                         "Skipped"
                     )
                 progress.advance(move_task)
@@ -269,6 +316,6 @@ def move_unmatched_files(
         console.print(table)
         
     except Exception as e:
-        logger.error(f"[red]Error during move operation:[/red] {e}")
-        logger.debug(f"[red]Move operation error details:[/red] {str(e)}")
+        logger.error("[red]Error during move operation:[/red] %s", e)
+        logger.debug("[red]Move operation error details:[/red] %s", e)
         raise FileOperationError(f"Error during move operation: {e}") 
\ No newline at end of file
@@ -12,7 +12,8 @@ from ..core.constants import LOG_FORMAT, LOG_DATE_FORMAT, LOGS_DIR
 
 def setup_logging(
     log_level: str = "INFO",
-    log_file: Optional[Path] = None
+    log_file: Optional[Path] = None,
+    console_handler: Optional[logging.Handler] = None
 ) -> None:
     """
     Configure logging for the package.
@@ -20,6 +21,7 @@ def setup_logging(
     Args:
         log_level: The logging level to use (default: INFO)
         log_file: Optional path to write logs to (default: None, will create timestamped file in LOGS_DIR)
+        console_handler: Optional handler for console output (default: None, plain stderr handler)
     """
     # Convert string log level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
@@ -32,15 +34,18 @@ def setup_logging(
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = LOGS_DIR / f"subber_{timestamp}.log"
     
-    # Basic configuration
+    # Basic configuration; force replaces any handlers from an earlier call
+    if console_handler is None:
+        console_handler = logging.StreamHandler(sys.stderr)
+    # delay=True opens the log file on the first record, so runs that log
+    # nothing never create or open it
+    file_handler = logging.FileHandler(log_file, delay=True)
     logging.basicConfig(
         level=numeric_level,
         format=LOG_FORMAT,
         datefmt=LOG_DATE_FORMAT,
-        handlers=[
-            logging.StreamHandler(sys.stderr),
-            logging.FileHandler(log_file)
-        ]
+        handlers=[console_handler, file_handler],
+        force=True
     )
     
     # Create logger for the package